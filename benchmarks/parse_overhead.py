@@ -0,0 +1,120 @@
+"""Compare parse_camel_xml (with validation) against the original ET.parse + findall loop.
+
+Usage: python benchmarks/parse_overhead.py [ROUTES] [--budget PERCENT]
+Exits 1 if the validating parser is more than PERCENT (default 10) slower,
+judged on the median of interleaved rounds. The result depends on the machine
+and its load; it is a measurement, not a guarantee, and is not part of the
+test suite.
+"""
+import argparse
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cameltospring.parser import parse_camel_xml  # noqa: E402
+
+NAMESPACE = {'camel': 'http://camel.apache.org/schema/spring'}
+
+ROUTE = '''  <route>
+    <from uri="restlet:/protected/bacs-payment/payeelist?restletMethod=get"/>
+    <removeHeaders pattern="CamelHttp*"/>
+    <process ref="payeeListCountProcessor"/>
+    <setHeader headerName="CamelHttpMethod">
+      <constant>GET</constant>
+    </setHeader>
+    <log message="start" loggingLevel="DEBUG"/>
+    <to uri="direct:connect-to-mule"/>
+    <unmarshal>
+      <json library="Jackson" unmarshalTypeName="com.example.BacsPayeeListMuleResp"/>
+    </unmarshal>
+    <to uri="direct:translate-and-marshall"/>
+  </route>
+'''
+
+
+def baseline_parse(xml_file):
+    """The parse loop from the original Camel.py, without any validation."""
+    root = ET.parse(xml_file).getroot()
+    routes = []
+    for route in root.findall('.//camel:route', NAMESPACE):
+        route_data = {'from': route.find('camel:from', NAMESPACE).get('uri'), 'steps': []}
+        for elem in route:
+            step = {}
+            if elem.tag.endswith('from'):
+                continue
+            elif elem.tag.endswith('removeHeaders'):
+                step['type'] = 'removeHeaders'
+                step['pattern'] = elem.get('pattern')
+            elif elem.tag.endswith('process'):
+                step['type'] = 'process'
+                step['ref'] = elem.get('ref')
+            elif elem.tag.endswith('setHeader'):
+                step['type'] = 'setHeader'
+                step['headerName'] = elem.get('headerName')
+                step['constant'] = elem.find('camel:constant', NAMESPACE).text
+            elif elem.tag.endswith('log'):
+                step['type'] = 'log'
+                step['message'] = elem.get('message')
+                step['loggingLevel'] = elem.get('loggingLevel')
+            elif elem.tag.endswith('to'):
+                step['type'] = 'to'
+                step['uri'] = elem.get('uri')
+            elif elem.tag.endswith('unmarshal'):
+                step['type'] = 'unmarshal'
+                json_elem = elem.find('camel:json', NAMESPACE)
+                if json_elem is not None:
+                    step['library'] = json_elem.get('library')
+                    step['unmarshalTypeName'] = json_elem.get('unmarshalTypeName')
+            route_data['steps'].append(step)
+        routes.append(route_data)
+    return routes
+
+
+def time_rounds(functions, xml_file, repeat):
+    """Wall times of each function per round, run interleaved so machine noise hits them alike."""
+    rounds = []
+    for _ in range(repeat):
+        times = []
+        for function in functions:
+            gc.collect()
+            start = time.perf_counter()
+            function(xml_file)
+            times.append(time.perf_counter() - start)
+        rounds.append(times)
+    return rounds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('routes', type=int, nargs='?', default=20000, help="routes in the generated file")
+    parser.add_argument('--budget', type=float, default=10.0, help="allowed slowdown in percent")
+    parser.add_argument('--repeat', type=int, default=15, help="interleaved rounds (default: 15)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        xml_file = os.path.join(tmp, 'routes.xml')
+        with open(xml_file, 'w') as file:
+            file.write('<routes xmlns="http://camel.apache.org/schema/spring">\n')
+            file.write(ROUTE * args.routes)
+            file.write('</routes>\n')
+
+        rounds = time_rounds([baseline_parse, parse_camel_xml], xml_file, args.repeat)
+
+    # The median of the per-round ratios: one slow round (GC, another process) does not decide the verdict.
+    overhead = (statistics.median(validating / baseline for baseline, validating in rounds) - 1) * 100
+    baseline = min(times[0] for times in rounds)
+    validating = min(times[1] for times in rounds)
+    print(f"baseline ET.parse loop: {baseline:.3f}s (best of {args.repeat})")
+    print(f"parse_camel_xml:        {validating:.3f}s (best of {args.repeat})")
+    print(f"median overhead:        {overhead:+.1f}% (budget +{args.budget:g}%)")
+    return 0 if overhead <= args.budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""Convert Apache Camel XML routes to Spring Boot Java DSL and JSON."""
+
+# Public API, resolved on first access so that importing the package (and
+# therefore starting the CLI) does not pay for the XML parser up front.
+_EXPORTS = {
+    'SINKS': 'emitters',
+    'ValidationError': 'validation',
+    'emit': 'emitters',
+    'generate_java_dsl': 'generator',
+    'generate_yaml_dsl': 'yaml_dsl',
+    'parse_camel_xml': 'parser',
+    'register_sink': 'emitters',
+    'report_diagnostics': 'validation',
+    'routes_to_json': 'export',
+    'write_json': 'export',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,154 @@
+import contextlib
+import signal
+import threading
+import time
+
+from .parser import LimitExceeded, parse_camel_xml
+
+# Limits applied while parsing (see build_tree); the rest are enforced per worker here.
+PARSE_LIMITS = ('max_bytes', 'max_depth', 'max_elements')
+
+
+def can_time_out():
+    """Whether time_budget works here: it needs SIGALRM timers (Unix) and the main thread."""
+    return hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+
+
+@contextlib.contextmanager
+def time_budget(seconds):
+    """Raise LimitExceeded in the current (main) thread if the block runs longer than seconds."""
+    if not seconds:
+        yield
+        return
+
+    def expire(signum, frame):
+        raise LimitExceeded(f"wall-clock budget of {seconds:g}s exceeded")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def limit_memory(max_memory_mb):
+    """Cap this process's address space, which bounds its RSS from above."""
+    import resource
+
+    limit = max_memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+# Symbol table of the current worker, set once by init_worker instead of travelling with every job.
+worker_refs = None
+
+
+def init_worker(known_refs, max_memory_mb):
+    global worker_refs
+    worker_refs = known_refs
+    if max_memory_mb:
+        limit_memory(max_memory_mb)
+
+
+def parse_limited(job):
+    xml_file, limits = job
+    known_refs = worker_refs
+    result = {'file': xml_file, 'status': 'ok', 'routes': [], 'diagnostics': [], 'error': None, 'seconds': 0.0}
+    parse_limits = {name: limits[name] for name in PARSE_LIMITS if limits.get(name) is not None}
+    if limits.get('timeout'):
+        parse_limits['incremental'] = True  # so the alarm is not held off until ET.parse returns
+
+    start = time.perf_counter()
+    try:
+        with time_budget(limits.get('timeout')):
+            result['routes'] = parse_camel_xml(xml_file, result['diagnostics'], known_refs, parse_limits)
+    except LimitExceeded as e:
+        result['status'] = 'failed'
+        result['error'] = str(e)
+    except MemoryError:
+        result['status'] = 'failed'
+        result['error'] = f"memory ceiling of {limits.get('max_memory_mb')} MB exceeded"
+    except OSError as e:
+        result['status'] = 'failed'
+        result['error'] = str(e)
+    except Exception as e:  # e.g. LookupError for an unknown encoding, as run_pool reports it
+        result['status'] = 'failed'
+        result['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        result['seconds'] = time.perf_counter() - start
+
+    if result['status'] == 'failed':
+        result['routes'] = []
+    return result
+
+
+def failed_result(xml_file, error):
+    return {'file': xml_file, 'status': 'failed', 'routes': [], 'diagnostics': [], 'error': error, 'seconds': 0.0}
+
+
+def run_pool(work, jobs, known_refs, max_memory_mb):
+    """Run jobs in a process pool; return ({job index: result}, indexes left unfinished by a dead worker)."""
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    results = {}
+    unfinished = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                             initargs=(known_refs, max_memory_mb)) as executor:
+        futures = [(index, executor.submit(parse_limited, work[index])) for index in sorted(work)]
+        for index, future in futures:
+            try:
+                results[index] = future.result()
+            except BrokenProcessPool:
+                unfinished.append(index)
+            except Exception as e:  # e.g. MemoryError while sending the result back
+                results[index] = failed_result(work[index][0], f"{type(e).__name__}: {e}")
+    return results, unfinished
+
+
+def parse_files(xml_files, limits=None, known_refs=None, jobs=1):
+    """Parse each file under the given limits and return one result per file, in order.
+
+    limits may set max_bytes, max_depth and max_elements (checked while
+    streaming), timeout (seconds of wall-clock per file, Unix only) and
+    max_memory_mb (per worker process, Unix only). A file that exceeds a
+    limit, or whose worker dies, gets status 'failed' and an error message;
+    the other files are still parsed.
+    """
+    limits = limits or {}
+    max_memory_mb = limits.get('max_memory_mb')
+    if limits.get('timeout') and not hasattr(signal, 'setitimer'):
+        raise ValueError("a per-file timeout needs signal.setitimer, which this platform lacks")
+
+    work = {index: (xml_file, limits) for index, xml_file in enumerate(xml_files)}
+
+    # The memory ceiling must not apply to this process, and the timer only
+    # works on the main thread; otherwise the files go to worker processes.
+    if jobs <= 1 and not max_memory_mb and (not limits.get('timeout') or can_time_out()):
+        init_worker(known_refs, None)
+        try:
+            return [parse_limited(work[index]) for index in sorted(work)]
+        finally:
+            init_worker(None, None)
+
+    jobs = max(jobs, 1)
+    results = {}
+    while work:
+        finished, unfinished = run_pool(work, jobs, known_refs, max_memory_mb)
+        results.update(finished)
+        if not unfinished:
+            break
+
+        # A worker died and took the pool with it. Only the first jobs + 1
+        # unfinished jobs can have been handed to workers; rerun each of those
+        # alone so a crash pins down its file, then carry on with the rest.
+        for index in unfinished[:jobs + 1]:
+            isolated, crashed = run_pool({index: work[index]}, 1, known_refs, max_memory_mb)
+            results.update(isolated)
+            if crashed:
+                results[index] = failed_result(work[index][0], "worker process died")
+        work = {index: work[index] for index in unfinished[jobs + 1:]}
+
+    return [results[index] for index in sorted(results)]
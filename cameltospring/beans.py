@@ -0,0 +1,75 @@
+import os
+import xml.etree.ElementTree as ET
+
+from .files import file_hash, find_xml_files
+
+CACHE_VERSION = 1
+
+
+def scan_beans(xml_file):
+    """Return {bean id: class} for the <bean> definitions in a Spring XML file, in one streaming pass."""
+    beans = {}
+    for event, elem in ET.iterparse(xml_file, events=('end',)):
+        if elem.tag == 'bean' or elem.tag.endswith('}bean'):
+            if elem.get('id') and elem.get('class'):
+                beans[elem.get('id')] = elem.get('class')
+            elem.clear()
+    return beans
+
+
+def load_cache(cache_file):
+    import json
+
+    try:
+        with open(cache_file) as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('version') == CACHE_VERSION else {}
+
+
+def save_cache(cache_file, files):
+    import json
+
+    with open(cache_file, 'w') as file:
+        json.dump({'version': CACHE_VERSION, 'files': files}, file)
+
+
+def build_symbol_table(paths, cache_file=None):
+    """Index <bean id class> definitions across Spring XML files (or directories) into {bean id: class}.
+
+    With cache_file, each file's beans are stored keyed by its content hash
+    and only files whose hash changed are parsed again. Later definitions
+    of the same id override earlier ones, as in Spring.
+    """
+    cache = load_cache(cache_file) if cache_file else {}
+    changed = False
+    symbols = {}
+
+    for xml_file in find_xml_files(paths):
+        path = os.path.abspath(xml_file)
+        digest = file_hash(path)
+        entry = cache.get(path)
+        if entry is None or entry['hash'] != digest:
+            try:
+                entry = {'hash': digest, 'beans': scan_beans(path)}
+            except ET.ParseError as e:
+                print(f"Error parsing beans in {xml_file}: {e}")
+                entry = {'hash': digest, 'beans': {}}
+            cache[path] = entry
+            changed = True
+        symbols.update(entry['beans'])
+
+    if cache_file and changed:
+        save_cache(cache_file, cache)
+
+    return symbols
+
+
+def resolve_refs(routes, symbols):
+    """Record the bean class of every process step whose ref is in symbols, as step['beanClass']."""
+    for route in routes:
+        for step in route['steps']:
+            if step['type'] == 'process' and step['ref'] in symbols:
+                step['beanClass'] = symbols[step['ref']]
+    return routes
@@ -0,0 +1,184 @@
+import argparse
+import sys
+
+# Keep this module's imports light: it is loaded for every invocation, including --help.
+
+
+def convert(args):
+    from .batch import parse_files
+    from .validation import ValidationError, report_diagnostics
+
+    symbols = load_symbols(args)
+    limits = {
+        'max_bytes': args.max_bytes,
+        'max_depth': args.max_depth,
+        'max_elements': args.max_elements,
+        'timeout': args.timeout,
+        'max_memory_mb': args.max_memory,
+    }
+    diagnostics = []
+    routes = []
+    failed = 0
+    try:
+        results = parse_files(args.xml_files, limits, symbols, args.jobs)
+    except ValueError as e:
+        print(f"Cannot convert: {e}")
+        return 2
+
+    for result in results:
+        if result['status'] == 'failed':
+            print(f"FAILED {result['file']}: {result['error']}")
+            failed += 1
+        diagnostics.extend(result['diagnostics'])
+        routes.extend(result['routes'])
+
+    try:
+        report_diagnostics(diagnostics, args.fail_on, args.max_failures)
+    except ValidationError as e:
+        print(f"Conversion aborted: {e}")
+        return 1
+
+    write_outputs(routes, args, symbols)
+    if failed:
+        print(f"{failed} of {len(args.xml_files)} file(s) failed and were left out")
+        return 1
+    return 0
+
+
+def load_symbols(args):
+    """Return the bean symbol table for --beans, or None when no Spring files were given."""
+    if not args.beans:
+        return None
+
+    from .beans import build_symbol_table
+
+    return build_symbol_table(args.beans, args.bean_cache)
+
+
+def write_outputs(routes, args, symbols=None):
+    from .emitters import SINKS, emit, sort_routes, write_manifest
+
+    if symbols:
+        from .beans import resolve_refs
+
+        resolve_refs(routes, symbols)
+
+    if args.stable:
+        routes = sort_routes(routes)
+
+    targets = {name: path for name, path in
+               (('java', args.output), ('json', args.json), ('yaml', args.yaml)) if path}
+    results = emit(routes, targets, only_changed=args.stable)
+    for name, result in results.items():
+        if result['written']:
+            print(f"{SINKS[name][0]} has been generated in {result['path']}")
+        else:
+            print(f"{SINKS[name][0]} in {result['path']} is unchanged")
+
+    if args.manifest:
+        write_manifest(args.manifest, results)
+
+
+def ingest(args):
+    from .store import ingest as ingest_files, open_store
+    from .validation import format_diagnostic
+
+    diagnostics = []
+    conn = open_store(args.db)
+    try:
+        ingested, unchanged, removed = ingest_files(conn, args.paths, diagnostics)
+    finally:
+        conn.close()
+
+    for diagnostic in diagnostics:
+        print(format_diagnostic(diagnostic))
+    print(f"Ingested {ingested} file(s) into {args.db}, {unchanged} unchanged, {removed} removed")
+    return 0
+
+
+def generate(args):
+    from .store import load_routes, open_store
+
+    conn = open_store(args.db)
+    try:
+        routes = load_routes(conn, args.file, step_type=args.step_type, uri=args.uri, ref=args.ref,
+                             unmarshal_type_name=args.unmarshal_type)
+    finally:
+        conn.close()
+
+    print(f"Loaded {len(routes)} route(s) from {args.db}")
+    write_outputs(routes, args, load_symbols(args))
+    return 0
+
+
+def add_output_arguments(parser):
+    parser.add_argument('-o', '--output', default='CamelRoutes.java',
+                        help="Java DSL output file (default: CamelRoutes.java, '' to skip)")
+    parser.add_argument('--json', help="also write the parsed routes as JSON to this file")
+    parser.add_argument('--yaml', help="also write the routes as Camel YAML DSL to this file")
+    parser.add_argument('--stable', action='store_true',
+                        help="reproducible output: sort routes and only rewrite files whose bytes change")
+    parser.add_argument('--manifest', metavar='FILE',
+                        help="record the sha256 of every output file in this JSON manifest")
+    parser.add_argument('--beans', action='append', metavar='PATH',
+                        help="Spring XML file or directory defining the processor beans (repeatable);"
+                             " resolved refs are injected as @Autowired fields")
+    parser.add_argument('--bean-cache', metavar='FILE',
+                        help="cache the bean symbol table here, keyed by file hash")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='cameltospring',
+        description="Convert Apache Camel XML routes to Spring Boot Java DSL.",
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert_parser = commands.add_parser('convert', help="convert Camel XML files (parsed once for all outputs)")
+    convert_parser.add_argument('xml_files', nargs='+', metavar='XML', help="Camel XML route files")
+    add_output_arguments(convert_parser)
+    convert_parser.add_argument('-j', '--jobs', type=int, default=1, help="worker processes (default: 1)")
+    convert_parser.add_argument('--max-bytes', type=int, help="fail files larger than this many bytes")
+    convert_parser.add_argument('--max-depth', type=int, help="fail files nested deeper than this")
+    convert_parser.add_argument('--max-elements', type=int, help="fail files with more elements than this")
+    convert_parser.add_argument('--timeout', type=float, help="wall-clock seconds allowed per file")
+    convert_parser.add_argument('--max-memory', type=int, metavar='MB',
+                                help="memory ceiling per worker process, in MB (runs files in workers)")
+    convert_parser.add_argument('--fail-on', choices=['error', 'warning'], default='error',
+                                help="lowest diagnostic severity that counts as a failure")
+    convert_parser.add_argument('--max-failures', type=int, default=0,
+                                help="failures tolerated before aborting (default: 0)")
+    convert_parser.set_defaults(handler=convert)
+
+    ingest_parser = commands.add_parser('ingest', help="store parsed routes in a SQLite database")
+    ingest_parser.add_argument('db', help="SQLite database file (created if missing)")
+    ingest_parser.add_argument('paths', nargs='+', metavar='PATH', help="Camel XML files or directories")
+    ingest_parser.set_defaults(handler=ingest)
+
+    generate_parser = commands.add_parser('generate', help="generate output from routes in a SQLite database")
+    generate_parser.add_argument('db', help="SQLite database written by ingest")
+    generate_parser.add_argument('--file', action='append', help="only routes from this XML file (repeatable)")
+    generate_parser.add_argument('--step-type', help="only routes with a step of this type")
+    generate_parser.add_argument('--uri', help="only routes with a step using this uri")
+    generate_parser.add_argument('--ref', help="only routes with a step using this ref")
+    generate_parser.add_argument('--unmarshal-type', help="only routes unmarshalling to this type")
+    add_output_arguments(generate_parser)
+    generate_parser.set_defaults(handler=generate)
+
+    # Listed for --help only; main() hands its arguments straight to the regression harness.
+    commands.add_parser('regress', add_help=False,
+                        help="compare output against golden files (see regress --help)")
+
+    return parser
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ['regress']:
+        from . import regression
+
+        return regression.main(argv[1:])
+
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,31 @@
+import os
+
+from .generator import generate_java_dsl
+from .parser import parse_camel_xml
+from .validation import ValidationError, report_diagnostics
+
+
+def upload_and_convert(output_dir='output'):
+    """Upload Camel XML files in a Colab notebook and convert them into output_dir/CamelRoutes.java."""
+    from google.colab import files  # Only available inside Colab
+
+    uploaded = files.upload()
+
+    diagnostics = []
+    routes = []
+    for xml_file in uploaded:
+        routes.extend(parse_camel_xml(xml_file, diagnostics))
+
+    try:
+        report_diagnostics(diagnostics)
+    except ValidationError as e:
+        print(f"Conversion aborted: {e}")
+        return None
+
+    os.makedirs(output_dir, exist_ok=True)
+    java_file_path = os.path.join(output_dir, 'CamelRoutes.java')
+    with open(java_file_path, 'w') as file:
+        file.write(generate_java_dsl(routes))
+
+    print(f"Java DSL code has been generated in {java_file_path}")
+    return java_file_path
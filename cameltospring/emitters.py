@@ -0,0 +1,151 @@
+import os
+
+from .files import file_hash
+from .generator import iter_java_dsl
+from .yaml_dsl import iter_yaml_dsl
+
+# Output sinks by name: (description, function(routes, file)).
+SINKS = {}
+
+
+def register_sink(name, description):
+    """Register a function(routes, file) that writes one output format from parsed routes."""
+    def register(write):
+        SINKS[name] = (description, write)
+        return write
+    return register
+
+
+@register_sink('java', 'Java DSL code')
+def write_java_sink(routes, file):
+    file.writelines(iter_java_dsl(routes))
+
+
+@register_sink('json', 'JSON data')
+def write_json_sink(routes, file):
+    import json
+
+    json.dump(routes, file, indent=2)
+
+
+@register_sink('yaml', 'YAML DSL')
+def write_yaml_sink(routes, file):
+    file.writelines(iter_yaml_dsl(routes))
+
+
+def sort_routes(routes):
+    """Return routes in a stable order that does not depend on document order.
+
+    Routes are ordered by id, then from uri, then their steps, so only
+    routes that are identical keep their relative document order.
+    """
+    import json
+
+    return sorted(routes, key=lambda route: (route.get('id') or '', route['from'],
+                                             json.dumps(route['steps'], sort_keys=True)))
+
+
+class HashingWriter:
+    """Text file interface over a binary file that hashes the UTF-8 bytes as they are written."""
+
+    def __init__(self, file):
+        import hashlib
+
+        self.file = file
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self.hash.update(data)
+        self.size += len(data)
+        self.file.write(data)
+        return len(text)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+
+def same_content(path, size, digest):
+    return os.path.isfile(path) and os.path.getsize(path) == size and file_hash(path) == digest
+
+
+def write_if_changed(path, data):
+    """Write data to path unless the file already holds exactly these bytes. Returns True if written."""
+    import hashlib
+
+    if same_content(path, len(data), hashlib.sha256(data).hexdigest()):
+        return False
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_sink(name, routes, path, only_changed=False):
+    """Stream one sink's output to path, hashing it on the way.
+
+    With only_changed the output streams to a temporary file instead, which
+    replaces path only if its hash differs from the file already there.
+    """
+    target = f"{path}.tmp" if only_changed else path
+    with open(target, 'wb') as file:
+        writer = HashingWriter(file)
+        SINKS[name][1](routes, writer)
+    digest = writer.hash.hexdigest()
+
+    written = True
+    if only_changed:
+        if same_content(path, writer.size, digest):
+            os.remove(target)
+            written = False
+        else:
+            os.replace(target, path)
+    return {'path': path, 'sha256': digest, 'written': written}
+
+
+def emit(routes, targets, only_changed=False):
+    """Write routes to every sink in targets ({sink name: path}), one thread per sink.
+
+    The routes are parsed once by the caller and shared read-only by all sinks.
+    With only_changed, files whose bytes would not change are left untouched.
+    Returns {sink name: {'path', 'sha256', 'written'}}.
+    """
+    for name in targets:
+        if name not in SINKS:
+            raise ValueError(f"unknown output format {name!r} (known: {', '.join(sorted(SINKS))})")
+
+    if len(targets) < 2:
+        return {name: write_sink(name, routes, path, only_changed) for name, path in targets.items()}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = {name: executor.submit(write_sink, name, routes, path, only_changed)
+                   for name, path in targets.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def write_manifest(manifest_file, results):
+    """Record the sha256 of each output in a JSON manifest, keeping entries for other outputs.
+
+    Paths are stored relative to the manifest, sorted, and the manifest itself
+    is only rewritten when its content changes.
+    """
+    import json
+
+    try:
+        with open(manifest_file) as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        manifest = {}
+
+    base = os.path.dirname(os.path.abspath(manifest_file))
+    for result in results.values():
+        manifest[os.path.relpath(os.path.abspath(result['path']), base)] = result['sha256']
+
+    data = (json.dumps(manifest, indent=2, sort_keys=True) + '\n').encode('utf-8')
+    return write_if_changed(manifest_file, data)
@@ -0,0 +1,9 @@
+def routes_to_json(routes):
+    import json  # Only paid for when JSON is actually requested
+
+    return json.dumps(routes, indent=2)
+
+
+def write_json(routes, json_file):
+    with open(json_file, 'w') as file:
+        file.write(routes_to_json(routes))
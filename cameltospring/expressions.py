@@ -0,0 +1,88 @@
+import re
+from functools import lru_cache
+
+# Expression languages we can translate, mapped to their Java DSL builder.
+LANGUAGES = {
+    'constant': 'constant',
+    'simple': 'simple',
+    'xpath': 'xpath',
+    'jsonpath': 'jsonpath',
+    'header': 'header',
+}
+
+# Attributes each language's node keeps (resultType) or that do not change the generated code.
+LANGUAGE_ATTRIBUTES = {
+    'constant': {'id', 'trim'},
+    'simple': {'id', 'trim', 'resultType'},
+    'xpath': {'id', 'trim', 'resultType'},
+    'jsonpath': {'id', 'trim', 'resultType'},
+    'header': {'id', 'trim'},
+}
+
+# A QName prefix in an xpath, e.g. "foo" in /foo:order (but not the axis in child::order).
+XPATH_PREFIX = re.compile(r'(?<![\w.:-])([A-Za-z_][\w.-]*):(?=[A-Za-z_*])')
+
+TRANSLATION_CACHE_SIZE = 4096
+
+
+def parse_expression(elem):
+    """Return an expression node for an expression element, or None if the language is unsupported."""
+    language = elem.tag.split('}', 1)[-1]
+    if language not in LANGUAGES:
+        return None
+
+    text = elem.text or ''
+    if elem.get('trim') != 'false':  # Camel trims expressions unless told otherwise
+        text = text.strip()
+
+    node = {'language': language, 'text': text}
+    if elem.get('resultType') and 'resultType' in LANGUAGE_ATTRIBUTES[language]:
+        node['resultType'] = elem.get('resultType')
+    return node
+
+
+def find_expression(parent):
+    """Return the first child of parent in a supported expression language, or None."""
+    for child in parent:
+        if child.tag.split('}', 1)[-1] in LANGUAGES:
+            return child
+    return None
+
+
+def unsupported_attributes(elem):
+    """Return the attributes of an expression element that its node cannot carry, sorted.
+
+    ElementTree does not keep xmlns declarations as attributes, so for xpath
+    the namespace prefixes used in the text are reported as xmlns:<prefix>.
+    """
+    language = elem.tag.split('}', 1)[-1]
+    known = LANGUAGE_ATTRIBUTES[language]
+    dropped = {name for name in elem.keys() if name not in known}
+    if language == 'xpath' and elem.text:
+        dropped.update(f"xmlns:{prefix}" for prefix in XPATH_PREFIX.findall(elem.text))
+    return sorted(dropped)
+
+
+# str.translate table for the inside of a Java string literal: named escapes
+# where Java has one, \uXXXX for the other control characters.
+JAVA_STRING_ESCAPES = {code: f"\\u{code:04x}" for code in range(0x20)}
+JAVA_STRING_ESCAPES.update({
+    ord('\\'): '\\\\', ord('"'): '\\"', ord('\n'): '\\n', ord('\r'): '\\r', ord('\t'): '\\t',
+    ord('\b'): '\\b', ord('\f'): '\\f',
+})
+
+
+def java_string(text):
+    return '"' + text.translate(JAVA_STRING_ESCAPES) + '"'
+
+
+@lru_cache(maxsize=TRANSLATION_CACHE_SIZE)
+def translate_expression(language, text, result_type=None):
+    args = java_string(text)
+    if result_type:
+        args += f", {result_type}.class"
+    return f"{LANGUAGES[language]}({args})"
+
+
+def expression_to_java(node):
+    return translate_expression(node['language'], node['text'], node.get('resultType'))
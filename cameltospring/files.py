@@ -0,0 +1,20 @@
+import hashlib
+import os
+
+
+def file_hash(path):
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def find_xml_files(paths):
+    """Expand directories in paths to the XML files below them."""
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    if name.endswith('.xml'):
+                        yield os.path.join(dirpath, name)
+        else:
+            yield path
@@ -0,0 +1,87 @@
+from .expressions import expression_to_java, java_string
+
+
+JAVA_KEYWORDS = frozenset('''
+    abstract assert boolean break byte case catch char class const continue default do double else enum
+    extends final finally float for goto if implements import instanceof int interface long native new
+    package private protected public return short static strictfp super switch synchronized this throw
+    throws transient try void volatile while true false null _
+'''.split())
+
+
+def is_java_identifier(name):
+    return name.isidentifier() and name not in JAVA_KEYWORDS
+
+
+def java_type(class_name):
+    """Source form of a binary class name: nested classes use '.' rather than '$'."""
+    return class_name.replace('$', '.')
+
+
+def injected_beans(routes):
+    """Return {ref: class} for processor refs resolved to a bean class that can be injected as a field."""
+    beans = {}
+    for route in routes:
+        for step in route['steps']:
+            if step['type'] == 'process' and step.get('beanClass') and is_java_identifier(step['ref']):
+                beans.setdefault(step['ref'], java_type(step['beanClass']))
+    return beans
+
+
+def iter_java_dsl(routes):
+    """Yield the Java RouteBuilder source for routes line by line."""
+    beans = injected_beans(routes)
+
+    imports = {
+        'org.apache.camel.builder.RouteBuilder',
+        'org.apache.camel.model.dataformat.JsonLibrary',
+        'org.springframework.stereotype.Component',
+    }
+    if beans:
+        imports.add('org.springframework.beans.factory.annotation.Autowired')
+    if any(step['type'] == 'log' and step.get('loggingLevel') for route in routes for step in route['steps']):
+        imports.add('org.apache.camel.LoggingLevel')
+    for name in sorted(imports):
+        yield f"import {name};\n"
+    yield "\n"
+    yield "@Component\n"
+    yield "public class CamelRoutes extends RouteBuilder {\n\n"
+
+    for ref, bean_class in sorted(beans.items()):
+        yield "    @Autowired\n"
+        yield f"    private {bean_class} {ref};\n\n"
+
+    yield "    @Override\n"
+    yield "    public void configure() throws Exception {\n"
+
+    for route in routes:
+        yield f"        from({java_string(route['from'])})\n"
+
+        for step in route['steps']:
+            if step['type'] == 'removeHeaders':
+                yield f"            .removeHeaders({java_string(step['pattern'])})\n"
+            elif step['type'] == 'process' and step['ref'] in beans:
+                yield f"            .process({step['ref']})\n"
+            elif step['type'] == 'process':
+                yield f"            .process({java_string(step['ref'])})\n"
+            elif step['type'] == 'setHeader':
+                yield f"            .setHeader({java_string(step['headerName'])}, {expression_to_java(step['expression'])})\n"
+            elif step['type'] == 'log' and step.get('loggingLevel'):
+                yield f"            .log(LoggingLevel.{step['loggingLevel']}, {java_string(step['message'])})\n"
+            elif step['type'] == 'log':
+                yield f"            .log({java_string(step['message'])})\n"
+            elif step['type'] == 'to':
+                yield f"            .to({java_string(step['uri'])})\n"
+            elif step['type'] == 'unmarshal' and step.get('unmarshalTypeName'):
+                yield f"            .unmarshal().json(JsonLibrary.{step['library']}, {step['unmarshalTypeName']}.class)\n"
+            elif step['type'] == 'unmarshal':
+                yield f"            .unmarshal().json(JsonLibrary.{step['library']})\n"
+
+        yield "            ;\n\n"
+
+    yield "    }\n"
+    yield "}\n"
+
+
+def generate_java_dsl(routes):
+    return ''.join(iter_java_dsl(routes))
@@ -0,0 +1,211 @@
+import os
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+
+from .expressions import LANGUAGES, find_expression, parse_expression, unsupported_attributes
+from .validation import LOGGING_LEVELS, REQUIRED_ATTRIBUTES, REQUIRED_DATA_FORMAT_ATTRIBUTES, add_diagnostic
+
+NAMESPACE = {'camel': 'http://camel.apache.org/schema/spring'}
+BEAN_TAGS = frozenset(('{http://www.springframework.org/schema/beans}bean', '{http://camel.apache.org/schema/spring}bean', 'bean'))
+
+
+class LimitExceeded(Exception):
+    pass
+
+
+class LineIndex:
+    """Source line of each element, worked out only when a diagnostic asks for one.
+
+    The tree is built by the C parser, which does not record positions, so
+    the first lookup re-reads the file once with expat and pairs its start
+    tags with the elements in document order. Files without problems never
+    pay for this.
+    """
+
+    def __init__(self, xml_file, root):
+        self.xml_file = xml_file
+        self.root = root
+        self.lines = None
+
+    def __getitem__(self, elem):
+        if self.lines is None:
+            self.lines = dict(zip(self.root.iter(), self.start_lines()))
+        return self.lines.get(elem)
+
+    def start_lines(self):
+        parser = expat.ParserCreate()
+        lines = []
+        parser.StartElementHandler = lambda tag, attrib: lines.append(parser.CurrentLineNumber)
+        with open(self.xml_file, 'rb') as file:
+            parser.ParseFile(file)
+        return lines
+
+
+def parse_bounded(xml_file, max_depth=None, max_elements=None):
+    """Build the tree like ET.parse, raising LimitExceeded as soon as it gets too deep or too large."""
+    depth_limit = max_depth if max_depth is not None else float('inf')
+    element_limit = max_elements if max_elements is not None else float('inf')
+    depth = elements = 0
+    root = None
+
+    for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+        if event == 'end':
+            depth -= 1
+            continue
+        if root is None:
+            root = elem
+        depth += 1
+        elements += 1
+        if depth > depth_limit:
+            raise LimitExceeded(f"element nesting deeper than {max_depth}")
+        if elements > element_limit:
+            raise LimitExceeded(f"more than {max_elements} elements")
+
+    return root
+
+
+def parse_incremental(xml_file):
+    """Build the tree like ET.parse, but from Python-level chunks so signal handlers can run in between."""
+    chunks = ET.iterparse(xml_file, events=())
+    for _ in chunks:
+        pass
+    return chunks.root
+
+
+def build_tree(xml_file, max_bytes=None, max_depth=None, max_elements=None, incremental=False):
+    """Parse the XML file and return (root, lines, bean ids).
+
+    lines is a LineIndex giving each element's source line on demand. The
+    optional limits are checked before and while reading and raise
+    LimitExceeded; without depth or element limits the file goes straight
+    through ET.parse. ET.parse holds on to the interpreter until the whole
+    file is read, so incremental=True (set for a timeout) reads it in chunks
+    instead, letting an alarm interrupt a huge file.
+    """
+    if max_bytes is not None and os.path.getsize(xml_file) > max_bytes:
+        raise LimitExceeded(f"file is larger than {max_bytes} bytes")
+
+    if max_depth is not None or max_elements is not None:
+        root = parse_bounded(xml_file, max_depth, max_elements)
+    elif incremental:
+        root = parse_incremental(xml_file)
+    else:
+        root = ET.parse(xml_file).getroot()
+
+    # One walk over the tree with a set lookup beats one C-filtered walk per tag.
+    bean_ids = {elem.get('id') for elem in root.iter() if elem.tag in BEAN_TAGS and elem.get('id')}
+    return root, LineIndex(xml_file, root), bean_ids
+
+
+def parse_camel_xml(xml_file, diagnostics=None, known_refs=None, limits=None):
+    """Parse routes from xml_file, validating each element as it is read.
+
+    Problems are appended to diagnostics (if given) instead of raising, and
+    steps that cannot be generated are left out of the result. Processor refs
+    are checked against known_refs plus any <bean> ids in the file itself.
+    limits ({'max_bytes', 'max_depth', 'max_elements', 'incremental'}) are
+    passed to build_tree; exceeding one raises LimitExceeded.
+    """
+    if diagnostics is None:
+        diagnostics = []
+
+    try:
+        root, lines, bean_ids = build_tree(xml_file, **(limits or {}))
+    except ET.ParseError as e:
+        add_diagnostic(diagnostics, xml_file, e.position[0], None, 'xml-syntax', expat.ErrorString(e.code))
+        return []
+
+    check_refs = known_refs is not None or bool(bean_ids)
+    if known_refs is None:
+        known_refs = ()
+
+    routes = []
+    for index, route in enumerate(root.iterfind('.//camel:route', NAMESPACE), 1):
+        route_id = route.get('id') or f"#{index}"
+        from_elem = route.find('camel:from', NAMESPACE)
+        if from_elem is None or from_elem.get('uri') is None:
+            add_diagnostic(diagnostics, xml_file, lines[route], route_id, 'missing-from',
+                           "route has no <from uri=...>")
+            continue
+
+        route_data = {
+            'from': from_elem.get('uri'),
+            'steps': []
+        }
+        if route.get('id'):
+            route_data['id'] = route.get('id')
+
+        for elem in route:
+            step = {}
+            tag = elem.tag.split('}', 1)[-1]  # Remove namespace
+
+            if tag == 'from':
+                continue
+
+            required = REQUIRED_ATTRIBUTES.get(tag)
+            if required and not all(map(elem.get, required)):
+                missing = [name for name in required if not elem.get(name)]
+                add_diagnostic(diagnostics, xml_file, lines[elem], route_id, 'missing-attribute',
+                               f"<{tag}> is missing {', '.join(missing)}")
+                continue
+
+            if tag == 'removeHeaders':
+                step['type'] = 'removeHeaders'
+                step['pattern'] = elem.get('pattern')
+            elif tag == 'process':
+                step['type'] = 'process'
+                step['ref'] = elem.get('ref')
+                if check_refs and step['ref'] not in bean_ids and step['ref'] not in known_refs:
+                    add_diagnostic(diagnostics, xml_file, lines[elem], route_id, 'unresolved-ref',
+                                   f"processor ref '{step['ref']}' has no matching bean", 'warning')
+            elif tag == 'setHeader':
+                expression_elem = find_expression(elem)
+                if expression_elem is None:
+                    add_diagnostic(diagnostics, xml_file, lines[elem], route_id, 'unsupported-expression',
+                                   f"<setHeader headerName=\"{elem.get('headerName')}\"> has no supported expression"
+                                   f" ({', '.join(LANGUAGES)})")
+                    continue
+                dropped = unsupported_attributes(expression_elem)
+                if dropped:
+                    add_diagnostic(diagnostics, xml_file, lines[expression_elem], route_id, 'unsupported-attribute',
+                                   f"<{expression_elem.tag.split('}', 1)[-1]}> attribute(s) {', '.join(dropped)}"
+                                   " are not carried into the generated code", 'warning')
+                step['type'] = 'setHeader'
+                step['headerName'] = elem.get('headerName')
+                step['expression'] = parse_expression(expression_elem)
+            elif tag == 'log':
+                if elem.get('loggingLevel') is not None and elem.get('loggingLevel') not in LOGGING_LEVELS:
+                    add_diagnostic(diagnostics, xml_file, lines[elem], route_id, 'invalid-attribute',
+                                   f"<log> loggingLevel \"{elem.get('loggingLevel')}\" is not one of"
+                                   f" {', '.join(LOGGING_LEVELS)}")
+                    continue
+                step['type'] = 'log'
+                step['message'] = elem.get('message')
+                step['loggingLevel'] = elem.get('loggingLevel')
+            elif tag == 'to':
+                step['type'] = 'to'
+                step['uri'] = elem.get('uri')
+            elif tag == 'unmarshal':
+                json_elem = elem.find('camel:json', NAMESPACE)
+                if json_elem is None:
+                    add_diagnostic(diagnostics, xml_file, lines[elem], route_id, 'unsupported-element',
+                                   "<unmarshal> only supports a <json> data format")
+                    continue
+                required = REQUIRED_DATA_FORMAT_ATTRIBUTES['json']
+                if not all(map(json_elem.get, required)):
+                    missing = [name for name in required if not json_elem.get(name)]
+                    add_diagnostic(diagnostics, xml_file, lines[json_elem], route_id, 'missing-attribute',
+                                   f"<json> is missing {', '.join(missing)}")
+                    continue
+                step['type'] = 'unmarshal'
+                step['library'] = json_elem.get('library')
+                step['unmarshalTypeName'] = json_elem.get('unmarshalTypeName')
+            else:
+                add_diagnostic(diagnostics, xml_file, lines[elem], route_id, 'unsupported-element',
+                               f"<{tag}> is not supported and was skipped")
+                continue
+            route_data['steps'].append(step)
+
+        routes.append(route_data)
+
+    return routes
@@ -0,0 +1,214 @@
+import argparse
+import contextlib
+import difflib
+import importlib
+import importlib.util
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Golden files live next to each other as <fixture>.java and <fixture>.json.
+GOLDEN_EXTENSIONS = ('.java', '.json')
+
+
+# Converters already loaded in this process, by name.
+CONVERTERS = {}
+
+
+def load_converter(name):
+    """Load a converter: an importable module such as cameltospring, or a legacy script.
+
+    Scripts are given by path (scripts/13june2.py) or by name (13june2),
+    which is looked up in the current directory, so the installed command
+    works from the repository root without it being on sys.path.
+    """
+    if name in CONVERTERS:
+        return CONVERTERS[name]
+
+    path = name if name.endswith('.py') else os.path.join(os.getcwd(), f"{name}.py")
+    with contextlib.redirect_stdout(io.StringIO()):
+        if os.path.isfile(path):
+            module_name = os.path.splitext(os.path.basename(path))[0]
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        else:
+            module = importlib.import_module(name)
+
+    CONVERTERS[name] = module
+    return module
+
+
+def convert(converter, xml_file):
+    """Run converter over xml_file and return its outputs keyed by golden extension."""
+    with contextlib.redirect_stdout(io.StringIO()):  # Silence the scripts' debugging prints
+        routes = converter.parse_camel_xml(xml_file)
+        outputs = {'.json': json.dumps(routes, indent=2) + '\n'}
+        if hasattr(converter, 'generate_java_dsl'):
+            outputs['.java'] = converter.generate_java_dsl(routes)
+    return outputs
+
+
+def find_fixtures(fixtures_dir):
+    return sorted(
+        os.path.join(fixtures_dir, name)
+        for name in os.listdir(fixtures_dir)
+        if name.endswith('.xml')
+    )
+
+
+def check_fixture(job):
+    converter_name, xml_file, golden_dir, update = job
+    stem = os.path.splitext(os.path.basename(xml_file))[0]
+    result = {'fixture': xml_file, 'status': 'pass', 'diffs': {}, 'seconds': 0.0}
+
+    start = time.perf_counter()
+    try:
+        outputs = convert(load_converter(converter_name), xml_file)
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = f"{type(e).__name__}: {e}"
+        return result
+    finally:
+        result['seconds'] = time.perf_counter() - start
+
+    compared = 0
+    for ext in GOLDEN_EXTENSIONS:
+        if ext not in outputs:
+            continue
+        actual = outputs[ext]
+        golden_file = os.path.join(golden_dir, stem + ext)
+        if update:
+            with open(golden_file, 'w') as file:
+                file.write(actual)
+            continue
+        if not os.path.exists(golden_file):
+            continue
+
+        compared += 1
+        with open(golden_file) as file:
+            expected = file.read()
+        if actual != expected:
+            result['status'] = 'fail'
+            result['diffs'][ext] = ''.join(difflib.unified_diff(
+                expected.splitlines(keepends=True),
+                actual.splitlines(keepends=True),
+                fromfile=golden_file,
+                tofile=f"{converter_name}({os.path.basename(xml_file)})",
+            ))
+
+    if update:
+        result['status'] = 'updated'
+    elif compared == 0:
+        result['status'] = 'missing'
+    return result
+
+
+def run(converter_name, fixtures_dir, golden_dir, jobs=None, update=False):
+    """Check every fixture in fixtures_dir in parallel and return the results in fixture order."""
+    fixtures = find_fixtures(fixtures_dir)
+    work = [(converter_name, xml_file, golden_dir, update) for xml_file in fixtures]
+    if update:
+        os.makedirs(golden_dir, exist_ok=True)
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(work) < 2:
+        return [check_fixture(job) for job in work]
+
+    chunksize = max(1, len(work) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(check_fixture, work, chunksize=chunksize))
+
+
+def print_report(results, show_diffs=True):
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+        print(f"{result['status'].upper():8} {result['seconds'] * 1000:8.2f} ms  {result['fixture']}")
+        if result['status'] == 'error':
+            print(f"    {result['error']}")
+        if show_diffs:
+            for diff in result['diffs'].values():
+                print(diff, end='')
+
+    total = sum(result['seconds'] for result in results)
+    summary = ', '.join(f"{count} {status}" for status, count in sorted(counts.items()))
+    print(f"{len(results)} fixture(s): {summary}; {total:.3f}s converter time")
+
+
+def measure_import_time(module='cameltospring.cli'):
+    """Return the cumulative import time of module in milliseconds, measured with -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True,
+    )
+    # Lines look like: "import time:   self [us] | cumulative | [indent]package"
+    for line in completed.stderr.splitlines():
+        match = re.match(r'import time:\s*\d+ \|\s*(\d+) \|\s*(\S+)$', line)
+        if match and match.group(2) == module:
+            return int(match.group(1)) / 1000
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def measure_command_import_time(argv, cwd=None):
+    """Return the total time in milliseconds spent importing while running cameltospring argv.
+
+    This covers the CLI itself plus everything its handler imports on the
+    way, such as the parser and the output sinks for convert.
+    """
+    marker = '-- cameltospring --'
+    code = (f"import sys; sys.stderr.write({marker!r} + '\\n'); sys.stderr.flush(); "
+            f"from cameltospring.cli import main; main({list(argv)!r})")
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True, cwd=cwd,
+    )
+    # Only top-level entries (no indent before the name) count; nested ones are in their cumulative time.
+    total = 0
+    for line in completed.stderr.split(marker, 1)[-1].splitlines():
+        match = re.match(r'import time:\s*\d+ \|\s*(\d+) \| (\S+)$', line)
+        if match:
+            total += int(match.group(1))
+    return total / 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='cameltospring regress', description="Compare converter output against golden Java/JSON files.")
+    parser.add_argument('fixtures', help="directory of XML fixtures")
+    parser.add_argument('golden', help="directory of golden <fixture>.java / <fixture>.json files")
+    parser.add_argument('-c', '--converter', default='cameltospring',
+                        help="converter module, or script name/path such as 13june2 (default: cameltospring)")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--update', action='store_true', help="rewrite the golden files from current output")
+    parser.add_argument('--no-diff', action='store_true', help="only list fixture status and timing")
+    parser.add_argument('--startup-budget', type=float, metavar='MS',
+                        help="also fail if importing the CLI takes longer than MS milliseconds")
+    args = parser.parse_args(argv)
+
+    try:
+        load_converter(args.converter)
+    except Exception as e:
+        print(f"Cannot load converter {args.converter}: {type(e).__name__}: {e}")
+        return 2
+
+    start = time.perf_counter()
+    results = run(args.converter, args.fixtures, args.golden, args.jobs, args.update)
+    print_report(results, show_diffs=not args.no_diff)
+    print(f"Wall time: {time.perf_counter() - start:.3f}s")
+
+    ok = all(result['status'] in ('pass', 'updated') for result in results)
+    if args.startup_budget is not None:
+        import_ms = measure_import_time()
+        print(f"CLI import time: {import_ms:.1f} ms (budget {args.startup_budget:g} ms)")
+        ok = ok and import_ms <= args.startup_budget
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+import json
+import os
+import sqlite3
+
+from .files import file_hash, find_xml_files
+from .parser import parse_camel_xml
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS routes (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    route_id TEXT,
+    from_uri TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    id INTEGER PRIMARY KEY,
+    route INTEGER NOT NULL REFERENCES routes(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    uri TEXT,
+    ref TEXT,
+    unmarshal_type_name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS routes_file ON routes(file);
+CREATE INDEX IF NOT EXISTS routes_from_uri ON routes(from_uri);
+CREATE INDEX IF NOT EXISTS steps_route ON steps(route);
+CREATE INDEX IF NOT EXISTS steps_type ON steps(type);
+CREATE INDEX IF NOT EXISTS steps_uri ON steps(uri);
+CREATE INDEX IF NOT EXISTS steps_ref ON steps(ref);
+CREATE INDEX IF NOT EXISTS steps_unmarshal_type_name ON steps(unmarshal_type_name);
+'''
+
+# load_routes() keyword filters mapped to the indexed steps columns.
+STEP_FILTERS = {
+    'step_type': 'type',
+    'uri': 'uri',
+    'ref': 'ref',
+    'unmarshal_type_name': 'unmarshal_type_name',
+}
+
+
+def open_store(db_file):
+    conn = sqlite3.connect(db_file)
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def store_routes(conn, path, routes):
+    for position, route in enumerate(routes):
+        cursor = conn.execute(
+            'INSERT INTO routes (file, position, route_id, from_uri) VALUES (?, ?, ?, ?)',
+            (path, position, route.get('id'), route['from']),
+        )
+        conn.executemany(
+            'INSERT INTO steps (route, position, type, uri, ref, unmarshal_type_name, data)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [
+                (cursor.lastrowid, step_position, step['type'], step.get('uri'), step.get('ref'),
+                 step.get('unmarshalTypeName'), json.dumps(step))
+                for step_position, step in enumerate(route['steps'])
+            ],
+        )
+
+
+def ingest(conn, paths, diagnostics=None):
+    """Parse XML files (or directories of them) into the store, skipping files whose content is unchanged.
+
+    Files that were stored under these paths but no longer exist are
+    removed along with their routes. A file that fails to parse is not
+    recorded, so it is parsed (and reported) again on the next run.
+    Returns (ingested, unchanged, removed) file counts.
+    """
+    if diagnostics is None:
+        diagnostics = []
+
+    ingested = unchanged = 0
+    seen = set()
+    with conn:
+        for xml_file in find_xml_files(paths):
+            path = os.path.abspath(xml_file)
+            if not os.path.isfile(path):
+                continue
+            seen.add(path)
+            digest = file_hash(path)
+            row = conn.execute('SELECT hash FROM files WHERE path = ?', (path,)).fetchone()
+            if row is not None and row[0] == digest:
+                unchanged += 1
+                continue
+
+            file_diagnostics = []
+            routes = parse_camel_xml(xml_file, file_diagnostics)
+            diagnostics.extend(file_diagnostics)
+            conn.execute('DELETE FROM files WHERE path = ?', (path,))
+            if any(diagnostic['rule'] == 'xml-syntax' for diagnostic in file_diagnostics):
+                continue
+            conn.execute('INSERT INTO files (path, hash) VALUES (?, ?)', (path, digest))
+            store_routes(conn, path, routes)
+            ingested += 1
+
+        roots = [os.path.abspath(path) for path in paths]
+        removed = [
+            (path,) for (path,) in conn.execute('SELECT path FROM files')
+            if path not in seen and any(path == root or path.startswith(root + os.sep) for root in roots)
+        ]
+        conn.executemany('DELETE FROM files WHERE path = ?', removed)
+
+    return ingested, unchanged, len(removed)
+
+
+def load_routes(conn, files=None, **step_filters):
+    """Rebuild route dicts from the store, ready for generate_java_dsl or emit.
+
+    files limits the result to routes from those XML files. step_filters
+    (step_type, uri, ref, unmarshal_type_name) keep only routes with at least
+    one matching step. Routes come back in file and document order.
+    """
+    conditions = []
+    params = []
+    if files is not None:
+        files = [os.path.abspath(path) for path in files]
+        conditions.append(f"r.file IN ({', '.join('?' * len(files))})")
+        params.extend(files)
+    for name, value in step_filters.items():
+        if name not in STEP_FILTERS:
+            raise TypeError(f"unknown step filter {name!r}")
+        if value is not None:
+            conditions.append(f"EXISTS (SELECT 1 FROM steps f WHERE f.route = r.id AND f.{STEP_FILTERS[name]} = ?)")
+            params.append(value)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    rows = conn.execute(
+        'SELECT r.id, r.route_id, r.from_uri, s.data FROM routes r LEFT JOIN steps s ON s.route = r.id'
+        f' {where} ORDER BY r.file, r.position, s.position',
+        params,
+    )
+
+    routes = []
+    last_id = None
+    for row_id, route_id, from_uri, data in rows:
+        if row_id != last_id:
+            last_id = row_id
+            route_data = {'from': from_uri, 'steps': []}
+            if route_id:
+                route_data['id'] = route_id
+            routes.append(route_data)
+        if data is not None:
+            route_data['steps'].append(json.loads(data))
+
+    return routes
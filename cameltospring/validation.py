@@ -0,0 +1,52 @@
+SEVERITIES = {'warning': 1, 'error': 2}
+
+# Attributes a step cannot be generated without.
+REQUIRED_ATTRIBUTES = {
+    'removeHeaders': ['pattern'],
+    'process': ['ref'],
+    'setHeader': ['headerName'],
+    'log': ['message'],
+    'to': ['uri'],
+}
+
+# Values of <log loggingLevel>, the constants of org.apache.camel.LoggingLevel.
+LOGGING_LEVELS = ('ERROR', 'WARN', 'INFO', 'DEBUG', 'TRACE', 'OFF')
+
+# Attributes a data format inside <unmarshal> cannot be generated without.
+REQUIRED_DATA_FORMAT_ATTRIBUTES = {
+    'json': ['library'],
+}
+
+
+class ValidationError(Exception):
+    def __init__(self, diagnostics):
+        self.diagnostics = diagnostics
+        super().__init__(f"{len(diagnostics)} problem(s) found")
+
+
+def add_diagnostic(diagnostics, xml_file, line, route_id, rule, message, severity='error'):
+    diagnostics.append({
+        'file': xml_file,
+        'line': line,
+        'route': route_id,
+        'rule': rule,
+        'severity': severity,
+        'message': message,
+    })
+
+
+def format_diagnostic(diagnostic):
+    location = f"{diagnostic['file']}:{diagnostic['line']}"
+    route = f" (route {diagnostic['route']})" if diagnostic['route'] else ''
+    return f"{location}: {diagnostic['severity']}: [{diagnostic['rule']}]{route} {diagnostic['message']}"
+
+
+def report_diagnostics(diagnostics, fail_on='error', max_failures=0):
+    """Print all diagnostics and raise ValidationError if too many reach fail_on."""
+    for diagnostic in diagnostics:
+        print(format_diagnostic(diagnostic))
+
+    level = SEVERITIES[fail_on]
+    failures = [d for d in diagnostics if SEVERITIES[d['severity']] >= level]
+    if len(failures) > max_failures:
+        raise ValidationError(failures)
@@ -0,0 +1,52 @@
+def yaml_string(text):
+    # A JSON string literal is also a valid YAML double-quoted scalar.
+    import json
+
+    return json.dumps(text, ensure_ascii=False)
+
+
+def iter_expression(expression, indent):
+    language = expression['language']
+    if 'resultType' in expression:
+        yield f"{indent}{language}:\n"
+        yield f"{indent}  expression: {yaml_string(expression['text'])}\n"
+        yield f"{indent}  resultType: {yaml_string(expression['resultType'])}\n"
+    else:
+        yield f"{indent}{language}: {yaml_string(expression['text'])}\n"
+
+
+def iter_yaml_dsl(routes):
+    """Yield the Camel YAML DSL for routes line by line."""
+    for route in routes:
+        yield "- route:\n"
+        if route.get('id'):
+            yield f"    id: {yaml_string(route['id'])}\n"
+        yield "    from:\n"
+        yield f"      uri: {yaml_string(route['from'])}\n"
+        yield "      steps:\n"
+
+        for step in route['steps']:
+            yield f"        - {step['type']}:\n"
+            if step['type'] == 'removeHeaders':
+                yield f"            pattern: {yaml_string(step['pattern'])}\n"
+            elif step['type'] == 'process':
+                yield f"            ref: {yaml_string(step['ref'])}\n"
+            elif step['type'] == 'setHeader':
+                yield f"            name: {yaml_string(step['headerName'])}\n"
+                yield from iter_expression(step['expression'], ' ' * 12)
+            elif step['type'] == 'log':
+                yield f"            message: {yaml_string(step['message'])}\n"
+                if step.get('loggingLevel'):
+                    yield f"            loggingLevel: {step['loggingLevel']}\n"
+            elif step['type'] == 'to':
+                yield f"            uri: {yaml_string(step['uri'])}\n"
+            elif step['type'] == 'unmarshal':
+                yield "            json:\n"
+                if step.get('library'):
+                    yield f"              library: {step['library']}\n"
+                if step.get('unmarshalTypeName'):
+                    yield f"              unmarshalTypeName: {yaml_string(step['unmarshalTypeName'])}\n"
+
+
+def generate_yaml_dsl(routes):
+    return ''.join(iter_yaml_dsl(routes))
@@ -0,0 +1,40 @@
+import os
+import textwrap
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROUTES = '''\
+<routes xmlns="http://camel.apache.org/schema/spring">
+    <route>
+        <from uri="restlet:/protected/bacs-payment/payeelist?restletMethod=get"/>
+        <removeHeaders pattern="CamelHttp*"/>
+        <process ref="payeeListCountProcessor"/>
+        <setHeader headerName="CamelHttpMethod">
+            <constant>GET</constant>
+        </setHeader>
+        <log message="start" loggingLevel="DEBUG"/>
+        <to uri="direct:connect-to-mule"/>
+        <unmarshal>
+            <json library="Jackson" unmarshalTypeName="com.example.BacsPayeeListMuleResp"/>
+        </unmarshal>
+    </route>
+</routes>
+'''
+
+
+@pytest.fixture
+def write_xml(tmp_path):
+    """Write an XML document (dedented) under tmp_path and return its path."""
+    def write(content=ROUTES, name='routes.xml'):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(content))
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def routes_xml(write_xml):
+    return write_xml()
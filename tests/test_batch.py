@@ -0,0 +1,73 @@
+import os
+import sys
+import threading
+
+import pytest
+
+from cameltospring import batch
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="limits rely on Unix signals and rlimits")
+
+
+def test_limits_fail_only_the_offending_file(write_xml):
+    good = write_xml()
+    deep = write_xml('<a>' * 50 + '</a>' * 50, name='deep.xml')
+    results = batch.parse_files([good, deep, good + '.missing'], {'max_depth': 20})
+
+    assert [result['status'] for result in results] == ['ok', 'failed', 'failed']
+    assert 'deeper than 20' in results[1]['error']
+    assert len(results[0]['routes']) == 1
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_any_exception_fails_only_its_file(write_xml, jobs):
+    bogus = write_xml('<?xml version="1.0" encoding="bogus"?><routes/>', name='enc.xml')
+    results = batch.parse_files([bogus, write_xml()], jobs=jobs)
+
+    assert [result['status'] for result in results] == ['failed', 'ok']
+    assert results[0]['error'].startswith('LookupError: ')
+
+
+def test_timeout_interrupts_a_large_file(tmp_path):
+    route = '<route><from uri="direct:a"/><to uri="direct:b"/><log message="x"/></route>\n'
+    big = tmp_path / 'big.xml'
+    with open(big, 'w') as file:
+        file.write('<routes xmlns="http://camel.apache.org/schema/spring">\n')
+        file.write(route * 300000)  # ~25 MB, several tenths of a second to parse even on a fast machine
+        file.write('</routes>\n')
+
+    [result] = batch.parse_files([str(big)], {'timeout': 0.05})
+    assert result['status'] == 'failed' and 'wall-clock budget' in result['error']
+    assert result['seconds'] < 0.25
+
+
+def test_timeout_off_the_main_thread_uses_workers(write_xml):
+    results = []
+    thread = threading.Thread(target=lambda: results.extend(batch.parse_files([write_xml()], {'timeout': 5})))
+    thread.start()
+    thread.join()
+    assert [result['status'] for result in results] == ['ok']
+
+
+def test_dead_worker_only_fails_its_own_file(write_xml, monkeypatch):
+    files = [write_xml(name=f"f{i}.xml") for i in range(8)]
+    real_parse = batch.parse_camel_xml
+
+    def crash_on_f2(xml_file, *args):
+        if xml_file.endswith('f2.xml'):
+            os._exit(9)
+        if xml_file.endswith('f5.xml'):
+            return [{'unpicklable': lambda: None}]
+        return real_parse(xml_file, *args)
+
+    monkeypatch.setattr(batch, 'parse_camel_xml', crash_on_f2)
+    results = batch.parse_files(files, jobs=2)
+
+    assert [result['file'] for result in results] == files
+    assert [result['status'] for result in results] == ['ok', 'ok', 'failed', 'ok', 'ok', 'failed', 'ok', 'ok']
+    assert results[2]['error'] == "worker process died"
+
+
+def test_known_refs_reach_the_workers(write_xml):
+    [result] = batch.parse_files([write_xml()], known_refs={'other': 'com.example.Other'}, jobs=2)
+    assert [d['rule'] for d in result['diagnostics']] == ['unresolved-ref']
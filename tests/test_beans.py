@@ -0,0 +1,52 @@
+import json
+
+from cameltospring import beans
+
+SPRING = '''\
+<beans xmlns="http://www.springframework.org/schema/beans">
+    <bean id="payeeListCountProcessor" class="com.example.PayeeListCountProcessor"/>
+    <bean id="mapper" class="com.example.Mapper"/>
+    <bean class="com.example.Anonymous"/>
+</beans>
+'''
+
+
+def test_scan_beans(write_xml):
+    assert beans.scan_beans(write_xml(SPRING)) == {
+        'payeeListCountProcessor': 'com.example.PayeeListCountProcessor',
+        'mapper': 'com.example.Mapper',
+    }
+
+
+def test_later_definitions_override(write_xml, tmp_path):
+    write_xml(SPRING, name='ctx/a.xml')
+    write_xml(SPRING.replace('com.example.Mapper', 'com.example.OtherMapper'), name='ctx/b.xml')
+    assert beans.build_symbol_table([str(tmp_path / 'ctx')])['mapper'] == 'com.example.OtherMapper'
+
+
+def test_cache_only_rescans_changed_files(write_xml, tmp_path, monkeypatch):
+    path = write_xml(SPRING, name='ctx/a.xml')
+    cache_file = str(tmp_path / 'beans.json')
+    symbols = beans.build_symbol_table([path], cache_file)
+
+    scanned = []
+    real_scan = beans.scan_beans
+    monkeypatch.setattr(beans, 'scan_beans', lambda xml_file: scanned.append(xml_file) or real_scan(xml_file))
+
+    assert beans.build_symbol_table([path], cache_file) == symbols
+    assert scanned == []
+
+    write_xml(SPRING.replace('mapper', 'renamed'), name='ctx/a.xml')
+    assert 'renamed' in beans.build_symbol_table([path], cache_file)
+    assert len(scanned) == 1
+    with open(cache_file) as file:
+        assert 'renamed' in json.load(file)['files'][path]['beans']
+
+
+def test_resolve_refs():
+    routes = [{'from': 'direct:a', 'steps': [{'type': 'process', 'ref': 'mapper'}, {'type': 'process', 'ref': 'x'}]}]
+    beans.resolve_refs(routes, {'mapper': 'com.example.Mapper'})
+    assert routes[0]['steps'] == [
+        {'type': 'process', 'ref': 'mapper', 'beanClass': 'com.example.Mapper'},
+        {'type': 'process', 'ref': 'x'},
+    ]
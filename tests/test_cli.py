@@ -0,0 +1,64 @@
+import json
+
+from cameltospring import cli
+from cameltospring.generator import generate_java_dsl
+from cameltospring.parser import parse_camel_xml
+
+BROKEN = '<routes xmlns="http://camel.apache.org/schema/spring"><route/></routes>'
+
+
+def test_convert_writes_java_and_json(routes_xml, tmp_path):
+    java = str(tmp_path / 'CamelRoutes.java')
+    routes_json = str(tmp_path / 'routes.json')
+
+    assert cli.main(['convert', routes_xml, '-o', java, '--json', routes_json]) == 0
+    assert (tmp_path / 'CamelRoutes.java').read_text() == generate_java_dsl(parse_camel_xml(routes_xml))
+    with open(routes_json) as file:
+        assert json.load(file) == parse_camel_xml(routes_xml)
+
+
+def test_convert_aborts_on_errors(write_xml, tmp_path, capsys):
+    broken = write_xml(BROKEN, name='broken.xml')
+    assert cli.main(['convert', broken, '-o', str(tmp_path / 'CamelRoutes.java')]) == 1
+    assert 'Conversion aborted' in capsys.readouterr().out
+    assert not (tmp_path / 'CamelRoutes.java').exists()
+
+
+def test_regress_is_dispatched(routes_xml, tmp_path):
+    golden = str(tmp_path / 'golden')
+    fixtures = str(tmp_path)
+    assert cli.main(['regress', fixtures, golden, '-j', '1', '--update']) == 0
+    assert cli.main(['regress', fixtures, golden, '-j', '1']) == 0
+
+
+def test_ingest_then_generate(write_xml, tmp_path, capsys):
+    write_xml(name='estate/a.xml')
+    db = str(tmp_path / 'routes.db')
+    java = str(tmp_path / 'Out.java')
+
+    assert cli.main(['ingest', db, str(tmp_path / 'estate')]) == 0
+    assert cli.main(['generate', db, '-o', java, '--step-type', 'unmarshal']) == 0
+    assert 'Loaded 1 route(s)' in capsys.readouterr().out
+    assert 'from("restlet:' in (tmp_path / 'Out.java').read_text()
+
+
+def test_stable_output_and_manifest(routes_xml, tmp_path, capsys):
+    java = str(tmp_path / 'CamelRoutes.java')
+    manifest = str(tmp_path / 'manifest.json')
+
+    assert cli.main(['convert', routes_xml, '-o', java, '--stable', '--manifest', manifest]) == 0
+    with open(manifest) as file:
+        assert list(json.load(file)) == ['CamelRoutes.java']
+
+    assert cli.main(['convert', routes_xml, '-o', java, '--stable']) == 0
+    assert 'is unchanged' in capsys.readouterr().out
+
+
+def test_failed_files_are_left_out(write_xml, routes_xml, tmp_path, capsys):
+    broken = write_xml(BROKEN, name='broken.xml')
+    java = str(tmp_path / 'CamelRoutes.java')
+
+    assert cli.main(['convert', routes_xml, broken, '-o', java, '--max-failures', '1', '--max-elements', '3']) == 1
+    out = capsys.readouterr().out
+    assert f"FAILED {routes_xml}: more than 3 elements" in out
+    assert '1 of 2 file(s) failed' in out
@@ -0,0 +1,81 @@
+import json
+import os
+
+import yaml
+
+from cameltospring.emitters import emit, register_sink, SINKS, sort_routes, write_manifest
+from cameltospring.generator import generate_java_dsl
+from cameltospring.parser import parse_camel_xml
+from cameltospring.yaml_dsl import generate_yaml_dsl
+
+
+def test_one_parse_feeds_every_sink(routes_xml, tmp_path):
+    routes = parse_camel_xml(routes_xml)
+    targets = {name: str(tmp_path / f"out.{name}") for name in ('java', 'json', 'yaml')}
+    results = emit(routes, targets)
+
+    assert (tmp_path / 'out.java').read_text() == generate_java_dsl(routes)
+    assert json.loads((tmp_path / 'out.json').read_text()) == routes
+    assert (tmp_path / 'out.yaml').read_text() == generate_yaml_dsl(routes)
+    assert all(result['written'] for result in results.values())
+
+
+def test_yaml_dsl_structure(routes_xml):
+    document = yaml.safe_load(generate_yaml_dsl(parse_camel_xml(routes_xml)))
+    steps = document[0]['route']['from']['steps']
+
+    assert document[0]['route']['from']['uri'] == 'restlet:/protected/bacs-payment/payeelist?restletMethod=get'
+    assert steps[2] == {'setHeader': {'name': 'CamelHttpMethod', 'constant': 'GET'}}
+    assert steps[5] == {'unmarshal': {'json': {
+        'library': 'Jackson', 'unmarshalTypeName': 'com.example.BacsPayeeListMuleResp'}}}
+
+
+def test_registered_sink(tmp_path):
+    @register_sink('count', 'Route count')
+    def write_count(routes, file):
+        file.write(f"{len(routes)}\n")
+
+    try:
+        emit([{'from': 'direct:a', 'steps': []}], {'count': str(tmp_path / 'count.txt')})
+        assert (tmp_path / 'count.txt').read_text() == '1\n'
+    finally:
+        del SINKS['count']
+
+
+def test_only_changed_leaves_identical_files_alone(routes_xml, tmp_path):
+    routes = parse_camel_xml(routes_xml)
+    path = str(tmp_path / 'CamelRoutes.java')
+    first = emit(routes, {'java': path}, only_changed=True)['java']
+    os.utime(path, (0, 0))
+
+    second = emit(routes, {'java': path}, only_changed=True)['java']
+    assert not second['written'] and second['sha256'] == first['sha256']
+    assert os.path.getmtime(path) == 0
+    assert not os.path.exists(path + '.tmp')
+
+    routes[0]['steps'].pop()
+    assert emit(routes, {'java': path}, only_changed=True)['java']['written']
+    assert os.path.getmtime(path) != 0
+
+
+def test_manifest_merges_and_is_stable(routes_xml, tmp_path):
+    routes = parse_camel_xml(routes_xml)
+    manifest = str(tmp_path / 'manifest.json')
+    results = emit(routes, {'java': str(tmp_path / 'A.java')})
+
+    assert write_manifest(manifest, results)
+    assert not write_manifest(manifest, results)
+    write_manifest(manifest, emit(routes, {'json': str(tmp_path / 'a.json')}))
+    with open(manifest) as file:
+        assert sorted(json.load(file)) == ['A.java', 'a.json']
+
+
+def test_sort_routes_ignores_document_order():
+    routes = [
+        {'from': 'direct:b', 'steps': [{'type': 'to', 'uri': 'x'}]},
+        {'from': 'direct:b', 'steps': []},
+        {'from': 'direct:a', 'steps': [], 'id': 'z'},
+        {'from': 'direct:c', 'steps': []},
+    ]
+    assert sort_routes(routes) == sort_routes(list(reversed(routes)))
+    assert [route['from'] for route in sort_routes(routes)] == ['direct:b', 'direct:b', 'direct:c', 'direct:a']
@@ -0,0 +1,58 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from cameltospring import expressions
+
+
+def element(xml):
+    return ET.fromstring(xml)
+
+
+@pytest.mark.parametrize('xml, java', [
+    ('<constant>GET</constant>', 'constant("GET")'),
+    ('<simple>${header.foo}</simple>', 'simple("${header.foo}")'),
+    ('<xpath resultType="java.lang.String">/order/@id</xpath>', 'xpath("/order/@id", java.lang.String.class)'),
+    ('<jsonpath>$.store.book[0]</jsonpath>', 'jsonpath("$.store.book[0]")'),
+    ('<header> foo </header>', 'header("foo")'),
+    ('<constant trim="false"> a </constant>', 'constant(" a ")'),
+    ('<constant>say "hi" \\o/</constant>', 'constant("say \\"hi\\" \\\\o/")'),
+    ('<constant trim="false">a&#13;b&#9;c&#10;</constant>', 'constant("a\\rb\\tc\\n")'),
+    ('<simple>\\u0041</simple>', 'simple("\\\\u0041")'),
+])
+def test_translation(xml, java):
+    assert expressions.expression_to_java(expressions.parse_expression(element(xml))) == java
+
+
+@pytest.mark.parametrize('text, literal', [
+    ('a\rb', '"a\\rb"'),
+    ('a\tb', '"a\\tb"'),
+    ('a\x00\x01\x1fb', '"a\\u0000\\u0001\\u001fb"'),
+    ('\b\f', '"\\b\\f"'),
+    ('caf\u00e9 \x7f', '"caf\u00e9 \x7f"'),
+])
+def test_java_string_escapes_control_characters(text, literal):
+    assert expressions.java_string(text) == literal
+
+
+def test_unsupported_language():
+    assert expressions.parse_expression(element('<groovy>x</groovy>')) is None
+    assert expressions.find_expression(element('<setHeader><groovy>x</groovy></setHeader>')) is None
+
+
+def test_unsupported_attributes():
+    xpath = element('<xpath xmlns:foo="urn:foo" saxon="true" resultType="String">/foo:a/child::b</xpath>')
+    assert expressions.unsupported_attributes(xpath) == ['saxon', 'xmlns:foo']
+    assert expressions.unsupported_attributes(element('<jsonpath suppressExceptions="true">$.a</jsonpath>')) == [
+        'suppressExceptions']
+    assert expressions.unsupported_attributes(element('<header resultType="String">foo</header>')) == ['resultType']
+    assert expressions.unsupported_attributes(element('<simple trim="false">x</simple>')) == []
+
+
+def test_translations_are_cached():
+    expressions.translate_expression.cache_clear()
+    for _ in range(3):
+        expressions.translate_expression('simple', '${body}')
+    info = expressions.translate_expression.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+    assert info.maxsize == expressions.TRANSLATION_CACHE_SIZE
@@ -0,0 +1,59 @@
+from cameltospring.beans import resolve_refs
+from cameltospring.generator import generate_java_dsl
+from cameltospring.parser import parse_camel_xml
+
+
+def test_generates_route_builder(routes_xml):
+    java = generate_java_dsl(parse_camel_xml(routes_xml))
+
+    assert java.startswith(
+        "import org.apache.camel.LoggingLevel;\n"
+        "import org.apache.camel.builder.RouteBuilder;\n"
+        "import org.apache.camel.model.dataformat.JsonLibrary;\n"
+        "import org.springframework.stereotype.Component;\n\n"
+    )
+    assert '        from("restlet:/protected/bacs-payment/payeelist?restletMethod=get")\n' in java
+    assert '            .process("payeeListCountProcessor")\n' in java
+    assert '            .setHeader("CamelHttpMethod", constant("GET"))\n' in java
+    assert '            .log(LoggingLevel.DEBUG, "start")\n' in java
+    assert '            .unmarshal().json(JsonLibrary.Jackson, com.example.BacsPayeeListMuleResp.class)\n' in java
+
+
+def test_escapes_every_literal():
+    routes = [{'from': 'file:C:\\in', 'steps': [
+        {'type': 'removeHeaders', 'pattern': 'a"b'},
+        {'type': 'log', 'message': 'say "hi"', 'loggingLevel': None},
+        {'type': 'to', 'uri': 'direct:"x"'},
+    ]}]
+    java = generate_java_dsl(routes)
+
+    assert 'from("file:C:\\\\in")' in java
+    assert '.removeHeaders("a\\"b")' in java
+    assert '.log("say \\"hi\\"")' in java
+    assert 'LoggingLevel' not in java
+    assert '.to("direct:\\"x\\"")' in java
+
+
+def test_resolved_beans_become_autowired_fields():
+    routes = [{'from': 'direct:a', 'steps': [
+        {'type': 'process', 'ref': 'zeta'},
+        {'type': 'process', 'ref': 'alpha'},
+        {'type': 'process', 'ref': 'default'},
+        {'type': 'process', 'ref': 'dashed-name'},
+        {'type': 'process', 'ref': 'unknown'},
+    ]}]
+    resolve_refs(routes, {'zeta': 'com.example.Outer$Zeta', 'alpha': 'com.example.Alpha',
+                          'default': 'com.example.D', 'dashed-name': 'com.example.X'})
+    java = generate_java_dsl(routes)
+
+    assert 'import org.springframework.beans.factory.annotation.Autowired;\n' in java
+    assert java.index('private com.example.Alpha alpha;') < java.index('private com.example.Outer.Zeta zeta;')
+    assert '.process(zeta)' in java and '.process(alpha)' in java
+    assert '.process("default")' in java and '.process("dashed-name")' in java and '.process("unknown")' in java
+    assert 'com.example.D ' not in java
+
+
+def test_unmarshal_without_a_type():
+    java = generate_java_dsl([{'from': 'direct:a', 'steps': [
+        {'type': 'unmarshal', 'library': 'Gson', 'unmarshalTypeName': None}]}])
+    assert '            .unmarshal().json(JsonLibrary.Gson)\n' in java
@@ -0,0 +1,112 @@
+import pytest
+
+from cameltospring.parser import LimitExceeded, parse_camel_xml
+
+
+def rules(diagnostics):
+    return [(d['line'], d['rule'], d['severity']) for d in diagnostics]
+
+
+def test_parses_all_step_types(routes_xml):
+    diagnostics = []
+    routes = parse_camel_xml(routes_xml, diagnostics)
+
+    assert diagnostics == []
+    assert [step['type'] for step in routes[0]['steps']] == [
+        'removeHeaders', 'process', 'setHeader', 'log', 'to', 'unmarshal']
+    assert routes[0]['steps'][2]['expression'] == {'language': 'constant', 'text': 'GET'}
+
+
+def test_collects_every_problem_with_its_line(write_xml):
+    xml_file = write_xml('''\
+        <routes xmlns="http://camel.apache.org/schema/spring">
+          <bean id="known" class="com.example.Known"/>
+          <route id="r1">
+            <from uri="direct:a"/>
+            <setHeader headerName="h"><groovy>x</groovy></setHeader>
+            <process ref="missing"/>
+            <process ref="known"/>
+            <choice/>
+            <to/>
+            <unmarshal><jaxb/></unmarshal>
+          </route>
+          <route><to uri="direct:b"/></route>
+        </routes>
+        ''')
+    diagnostics = []
+    routes = parse_camel_xml(xml_file, diagnostics)
+
+    assert rules(diagnostics) == [
+        (5, 'unsupported-expression', 'error'),
+        (6, 'unresolved-ref', 'warning'),
+        (8, 'unsupported-element', 'error'),
+        (9, 'missing-attribute', 'error'),
+        (10, 'unsupported-element', 'error'),
+        (12, 'missing-from', 'error'),
+    ]
+    assert diagnostics[0]['route'] == 'r1' and diagnostics[-1]['route'] == '#2'
+    assert [step['ref'] for step in routes[0]['steps']] == ['missing', 'known']
+
+
+def test_json_data_format_needs_a_library(write_xml):
+    xml_file = write_xml('''\
+        <routes xmlns="http://camel.apache.org/schema/spring">
+          <route>
+            <from uri="direct:a"/>
+            <unmarshal><json/></unmarshal>
+            <unmarshal><json library="Gson"/></unmarshal>
+          </route>
+        </routes>
+        ''')
+    diagnostics = []
+    routes = parse_camel_xml(xml_file, diagnostics)
+
+    assert rules(diagnostics) == [(4, 'missing-attribute', 'error')]
+    assert routes[0]['steps'] == [{'type': 'unmarshal', 'library': 'Gson', 'unmarshalTypeName': None}]
+
+
+def test_unknown_logging_level(write_xml):
+    xml_file = write_xml('''\
+        <routes xmlns="http://camel.apache.org/schema/spring">
+          <route>
+            <from uri="direct:a"/>
+            <log message="a" loggingLevel="VERBOSE"/>
+            <log message="b" loggingLevel="WARN"/>
+          </route>
+        </routes>
+        ''')
+    diagnostics = []
+    routes = parse_camel_xml(xml_file, diagnostics)
+
+    assert rules(diagnostics) == [(4, 'invalid-attribute', 'error')]
+    assert routes[0]['steps'] == [{'type': 'log', 'message': 'b', 'loggingLevel': 'WARN'}]
+
+
+def test_syntax_error_becomes_a_diagnostic(write_xml):
+    diagnostics = []
+    assert parse_camel_xml(write_xml('<camel:routes/>'), diagnostics) == []
+    assert rules(diagnostics) == [(1, 'xml-syntax', 'error')]
+
+
+def test_known_refs_enable_ref_checks(routes_xml):
+    diagnostics = []
+    parse_camel_xml(routes_xml, diagnostics, known_refs={'other': 'com.example.Other'})
+    assert rules(diagnostics) == [(5, 'unresolved-ref', 'warning')]
+
+    diagnostics = []
+    parse_camel_xml(routes_xml, diagnostics, known_refs={'payeeListCountProcessor': 'com.example.P'})
+    assert diagnostics == []
+
+
+@pytest.mark.parametrize('limits, message', [
+    ({'max_bytes': 10}, 'larger than 10 bytes'),
+    ({'max_depth': 3}, 'deeper than 3'),
+    ({'max_elements': 5}, 'more than 5 elements'),
+])
+def test_limits(routes_xml, limits, message):
+    with pytest.raises(LimitExceeded, match=message):
+        parse_camel_xml(routes_xml, limits=limits)
+
+
+def test_limits_that_are_not_hit_give_the_same_routes(routes_xml):
+    assert parse_camel_xml(routes_xml, limits={'max_depth': 10, 'max_elements': 100}) == parse_camel_xml(routes_xml)
@@ -0,0 +1,39 @@
+import os
+import shutil
+
+from cameltospring import regression
+
+from .conftest import ROOT
+
+
+def test_update_then_check(routes_xml, tmp_path):
+    fixtures = os.path.dirname(routes_xml)
+    golden = str(tmp_path / 'golden')
+
+    assert [r['status'] for r in regression.run('cameltospring', fixtures, golden, jobs=1, update=True)] == ['updated']
+    assert sorted(os.listdir(golden)) == ['routes' + ext for ext in sorted(regression.GOLDEN_EXTENSIONS)]
+    assert [r['status'] for r in regression.run('cameltospring', fixtures, golden, jobs=1)] == ['pass']
+
+    with open(os.path.join(golden, 'routes.java'), 'a') as file:
+        file.write('// drift\n')
+    [result] = regression.run('cameltospring', fixtures, golden, jobs=1)
+    assert result['status'] == 'fail' and '-// drift' in result['diffs']['.java']
+
+
+def test_loads_legacy_scripts_by_name_and_path(tmp_path, monkeypatch):
+    shutil.copy(os.path.join(ROOT, '13june2.py'), tmp_path / '13june2.py')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(regression, 'CONVERTERS', {})
+
+    assert hasattr(regression.load_converter('13june2'), 'generate_java_dsl')
+    assert hasattr(regression.load_converter(os.path.join(ROOT, 'Python1.py')), 'parse_camel_xml')
+
+
+def test_wrapper_scripts_are_converters(routes_xml, tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    golden = str(tmp_path / 'golden')
+    fixtures = os.path.dirname(routes_xml)
+    regression.run('cameltospring', fixtures, golden, jobs=1, update=True)
+
+    for script in ('Camel', 'UploadCamelingooglecollabs'):
+        assert [r['status'] for r in regression.run(script, fixtures, golden, jobs=1)] == ['pass']
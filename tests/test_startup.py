@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+from cameltospring.regression import measure_command_import_time, measure_import_time
+
+from .conftest import ROOT
+
+STARTUP_BUDGET_MS = 50
+
+
+def test_cli_import_time_within_budget(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    assert measure_import_time('cameltospring.cli') < STARTUP_BUDGET_MS
+
+
+def test_small_conversion_imports_within_budget(routes_xml, tmp_path):
+    argv = ['convert', routes_xml, '-o', str(tmp_path / 'CamelRoutes.java')]
+    assert measure_command_import_time(argv, cwd=ROOT) < STARTUP_BUDGET_MS
+    assert (tmp_path / 'CamelRoutes.java').exists()
+
+
+def test_cli_import_leaves_heavy_modules_unloaded():
+    heavy = ['xml.etree.ElementTree', 'json', 'concurrent.futures', 'sqlite3', 'cameltospring.parser']
+    code = f"import sys, cameltospring.cli; print([m for m in {heavy!r} if m in sys.modules])"
+    completed = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == '[]'
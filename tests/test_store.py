@@ -0,0 +1,75 @@
+import os
+
+from cameltospring.parser import parse_camel_xml
+from cameltospring.store import ingest, load_routes, open_store
+
+OTHER = '''\
+<routes xmlns="http://camel.apache.org/schema/spring">
+    <route id="other">
+        <from uri="direct:other"/>
+        <to uri="direct:end"/>
+    </route>
+</routes>
+'''
+
+
+def test_round_trip_and_filters(write_xml, tmp_path):
+    a = write_xml(name='estate/a.xml')
+    b = write_xml(OTHER, name='estate/b.xml')
+    conn = open_store(str(tmp_path / 'routes.db'))
+
+    assert ingest(conn, [str(tmp_path / 'estate')]) == (2, 0, 0)
+    assert load_routes(conn, [a]) == parse_camel_xml(a)
+    assert load_routes(conn) == parse_camel_xml(a) + parse_camel_xml(b)
+    assert load_routes(conn, unmarshal_type_name='com.example.BacsPayeeListMuleResp') == parse_camel_xml(a)
+    assert load_routes(conn, uri='direct:end') == parse_camel_xml(b)
+    assert load_routes(conn, step_type='process', ref='nope') == []
+
+
+def test_incremental_ingest(write_xml, tmp_path):
+    a = write_xml(name='estate/a.xml')
+    b = write_xml(OTHER, name='estate/b.xml')
+    estate = str(tmp_path / 'estate')
+    conn = open_store(str(tmp_path / 'routes.db'))
+    ingest(conn, [estate])
+
+    assert ingest(conn, [estate]) == (0, 2, 0)
+
+    write_xml(OTHER.replace('direct:end', 'direct:changed'), name='estate/b.xml')
+    assert ingest(conn, [estate]) == (1, 1, 0)
+    assert load_routes(conn, uri='direct:changed')
+
+    os.remove(b)
+    assert ingest(conn, [estate]) == (0, 1, 1)
+    assert load_routes(conn) == parse_camel_xml(a)
+
+
+def test_failed_parse_is_reported_on_every_run(write_xml, tmp_path):
+    write_xml('<camel:routes/>', name='estate/broken.xml')
+    estate = str(tmp_path / 'estate')
+    conn = open_store(str(tmp_path / 'routes.db'))
+
+    for _ in range(2):
+        diagnostics = []
+        assert ingest(conn, [estate], diagnostics) == (0, 0, 0)
+        assert [d['rule'] for d in diagnostics] == ['xml-syntax']
+
+
+def test_load_routes_is_one_query(write_xml, tmp_path):
+    for i in range(5):
+        write_xml(name=f"estate/{i}.xml")
+    write_xml('''\
+        <routes xmlns="http://camel.apache.org/schema/spring">
+          <route id="empty"><from uri="direct:empty"/></route>
+        </routes>
+        ''', name='estate/empty.xml')
+    conn = open_store(str(tmp_path / 'routes.db'))
+    ingest(conn, [str(tmp_path / 'estate')])
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    routes = load_routes(conn)
+
+    assert len(statements) == 1
+    assert len(routes) == 6 and all(len(route['steps']) == 6 for route in routes[:5])
+    assert routes[5] == {'from': 'direct:empty', 'steps': [], 'id': 'empty'}
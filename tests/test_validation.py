@@ -0,0 +1,27 @@
+import pytest
+
+from cameltospring.validation import ValidationError, add_diagnostic, format_diagnostic, report_diagnostics
+
+
+def make_diagnostics():
+    diagnostics = []
+    add_diagnostic(diagnostics, 'a.xml', 3, 'r1', 'unresolved-ref', "ref 'x' has no matching bean", 'warning')
+    add_diagnostic(diagnostics, 'a.xml', 7, None, 'missing-from', "route has no <from uri=...>")
+    return diagnostics
+
+
+def test_format():
+    warning, error = make_diagnostics()
+    assert format_diagnostic(warning) == "a.xml:3: warning: [unresolved-ref] (route r1) ref 'x' has no matching bean"
+    assert format_diagnostic(error) == "a.xml:7: error: [missing-from] route has no <from uri=...>"
+
+
+def test_report_raises_past_threshold(capsys):
+    with pytest.raises(ValidationError) as raised:
+        report_diagnostics(make_diagnostics())
+    assert [d['rule'] for d in raised.value.diagnostics] == ['missing-from']
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+    report_diagnostics(make_diagnostics(), max_failures=1)
+    with pytest.raises(ValidationError):
+        report_diagnostics(make_diagnostics(), fail_on='warning', max_failures=1)